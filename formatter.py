@@ -6,7 +6,7 @@
 import re
 from collections.abc import Callable
 
-from config import VoiceNoteConfig, resolve_api_key
+from config import VoiceNoteConfig, get_openai_client, resolve_api_key
 
 # 日本語フィラー語パターン（単独出現かつ文脈に依存しない語）
 _FILLER_PATTERNS = [
@@ -111,9 +111,7 @@ def _format_chunk_with_llm(
 ) -> str:
     """1チャンクをLLMで整形する。エラー時は元テキストを返す。"""
     try:
-        from openai import OpenAI
-
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key)
         response = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
@@ -9,6 +9,7 @@ import customtkinter as ctk
 
 from config import CONFIG_PATH, InvalidConfigError, VoiceNoteConfig, load_config, save_config
 from recorder import list_devices
+from transcriber import preload_model
 
 from .constants import (
     MODE_RECORD_ONLY,
@@ -162,6 +163,16 @@ class App(ctk.CTk):
         error_message = self._workflow.start(device_id, device_label)
         if error_message:
             messagebox.showerror("録音エラー", error_message)
+            return
+
+        if mode == MODE_RECORD_TRANSCRIBE and self._config.transcription_mode == "local":
+            # 録音中にモデルロードを並行して進め、停止後の待ち時間を隠す
+            preload_model(
+                self._config.whisper_model,
+                device=self._config.device,
+                compute_type=self._config.compute_type,
+                cpu_threads=self._config.cpu_threads,
+            )
 
     def _stop_recording(self):
         self._set_processing(True)
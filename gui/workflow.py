@@ -159,13 +159,14 @@ class RecordingWorkflow:
                 self._callbacks.on_record_only_done(audio_file)
                 return
 
-            self._run_transcription(audio_file)
+            # 録音データをそのまま渡し、保存したばかりのWAVの再デコードを省略する
+            self._run_transcription(audio_file, audio_data=audio_data)
         except Exception:
             _logger.error("_process_audio で未捕捉の例外:\n%s", traceback.format_exc())
             log_name = self._log_file.name if self._log_file else "ログファイル"
             self._callbacks.on_error(f"予期せぬエラーが発生しました（ログを確認: {log_name}）")
 
-    def _run_transcription(self, audio_file: Path):
+    def _run_transcription(self, audio_file: Path, audio_data: np.ndarray | None = None):
         _logger.debug("_run_transcription 開始: %s", audio_file)
         start_time = time.time()
         self._callbacks.on_log("文字起こし開始...")
@@ -177,7 +178,7 @@ class RecordingWorkflow:
 
         try:
             saved_path = transcribe_and_save(
-                audio_file, self._config, progress_callback=on_progress
+                audio_file, self._config, progress_callback=on_progress, audio_data=audio_data
             )
         except Exception as e:
             _logger.error("transcribe_and_save エラー:\n%s", traceback.format_exc())
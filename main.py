@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 """VoiceNote GUI エントリーポイント (CustomTkinter)"""
 
+import os
 import socket
 import sys
 
+# BLAS のスレッドプールが CTranslate2 のデコーダスレッドと CPU を奪い合わないよう、
+# numpy がロードされる前に1本へ固定する（理由の詳細は transcriber.py）
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
 from dotenv import load_dotenv
 
-from gui.app import App
 from logging_setup import setup_logging
 
 _LOCK_PORT = 47391  # 衝突しにくい固定ポートでシングルインスタンスを保証
@@ -31,6 +36,10 @@ def main():
         sys.exit(0)
 
     try:
+        # customtkinter・sounddevice を連れてくるため、ロック取得後に import する
+        # （二重起動時はロードせず即終了できる）
+        from gui.app import App
+
         load_dotenv()
         log_file = setup_logging()
         app = App(log_file=log_file)
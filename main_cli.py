@@ -4,9 +4,15 @@
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
+# BLAS のスレッドプールが CTranslate2 のデコーダスレッドと CPU を奪い合わないよう、
+# numpy がロードされる前に1本へ固定する（理由の詳細は transcriber.py）
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
@@ -15,14 +21,17 @@ from rich.table import Table
 
 from config import InvalidConfigError, VoiceNoteConfig
 from logging_setup import setup_logging
-from pipeline import load_or_configure, save_wav, transcribe_and_save
-from recorder import default_input_name, list_devices, record_audio
+
+# pipeline / recorder / transcriber は numpy・sounddevice 等の重いモジュールを
+# 連れてくるため、--help や引数エラーで即終了するパスで払わないよう関数内で import する
 
 console = Console()
 
 
 def print_devices():
     """利用可能なオーディオデバイス一覧を表示"""
+    from recorder import default_input_name, list_devices
+
     table = Table(title="利用可能なオーディオデバイス")
     table.add_column("ID", style="cyan", justify="right")
     table.add_column("デバイス名", style="green")
@@ -35,8 +44,22 @@ def print_devices():
     console.print(f"\n[dim]デフォルト入力: {default_input_name()}[/dim]")
 
 
-def _run_transcription(audio_file: Path, config: VoiceNoteConfig) -> Path:
-    """Rich Progress を駆動しつつ pipeline.transcribe_and_save を実行する。"""
+def _run_transcription(audio_file: Path, config: VoiceNoteConfig, audio_data=None) -> Path:
+    """Rich Progress を駆動しつつ pipeline.transcribe_and_save を実行する。
+
+    パイプやリダイレクト先など TTY でない場合はスピナーを立てず、進捗を素の
+    print で流す。Progress のライブ描画スレッドと ANSI 再描画のコストを払わず、
+    ログにも制御文字が混ざらない。
+    """
+    from pipeline import transcribe_and_save
+
+    if not console.is_terminal:
+        saved_path = transcribe_and_save(
+            audio_file, config, progress_callback=console.print, audio_data=audio_data
+        )
+        console.print("✓ 文字起こし完了")
+        return saved_path
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -51,7 +74,9 @@ def _run_transcription(audio_file: Path, config: VoiceNoteConfig) -> Path:
                 progress.console.print(f"[yellow]{msg}[/yellow]")
             progress.update(task, description=msg)
 
-        saved_path = transcribe_and_save(audio_file, config, progress_callback=on_progress)
+        saved_path = transcribe_and_save(
+            audio_file, config, progress_callback=on_progress, audio_data=audio_data
+        )
         progress.update(task, completed=True)
 
     console.print("[green]✓ 文字起こし完了[/green]")
@@ -81,6 +106,10 @@ def main():
         sys.exit(1)
 
     setup_logging()
+    from pipeline import load_or_configure, save_wav
+    from recorder import record_audio
+    from transcriber import preload_model
+
     try:
         config = load_or_configure(force_config=args.config)
     except (InvalidConfigError, RuntimeError) as e:
@@ -121,6 +150,15 @@ def main():
     def on_stop():
         console.print("\n[yellow]録音を停止しています...[/yellow]")
 
+    if not args.record_only and config.transcription_mode == "local":
+        # 録音中にモデルロードを並行して進め、停止後の待ち時間を隠す
+        preload_model(
+            config.whisper_model,
+            device=config.device,
+            compute_type=config.compute_type,
+            cpu_threads=config.cpu_threads,
+        )
+
     try:
         audio_data = record_audio(device=args.device, on_start=on_start, on_stop=on_stop)
     except (ValueError, RuntimeError) as e:
@@ -144,7 +182,8 @@ def main():
         return
 
     try:
-        saved_path = _run_transcription(audio_file, config)
+        # 録音データをそのまま渡し、保存したばかりのWAVの再デコードを省略する
+        saved_path = _run_transcription(audio_file, config, audio_data=audio_data)
     except Exception as e:
         console.print(f"[red]{e}[/red]")
         sys.exit(1)
@@ -9,6 +9,18 @@ frontmatter は Obsidian の規約に準拠しているが、他の Markdown ベ
 from datetime import datetime
 from pathlib import Path
 
+# frontmatter テンプレートはモジュールロード時に1度だけ組み立てる
+_NOTE_TEMPLATE = """---
+created: {created}
+type: transcription
+format_mode: {format_mode}
+tags:
+  - recording
+  - raw
+---
+{transcription}
+"""
+
 
 def save_transcript(save_folder: Path, transcription: str, format_mode: str = "none") -> Path:
     """文字起こし結果を `save_folder/YYYY-MM-DD_HHMMSS_raw.md` として保存する。
@@ -27,24 +39,20 @@ def save_transcript(save_folder: Path, transcription: str, format_mode: str = "n
     save_folder = Path(save_folder)
     save_folder.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
-    filepath = save_folder / f"{timestamp}_raw.md"
+    # now は1回だけ取得し、ファイル名と frontmatter の created を同じ時刻から導出する
+    # （2回呼ぶと秒境界をまたいだ際にファイル名と created がずれる）
+    now = datetime.now()
+    filepath = save_folder / f"{now.strftime('%Y-%m-%d_%H%M%S')}_raw.md"
 
-    now = datetime.now().isoformat()
-    content = f"""---
-created: {now}
-type: transcription
-format_mode: {format_mode}
-tags:
-  - recording
-  - raw
----
-{transcription}
-"""
+    content = _NOTE_TEMPLATE.format(
+        created=now.isoformat(),
+        format_mode=format_mode,
+        transcription=transcription,
+    )
 
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
+        # write_text は open/write/close を1呼び出しにまとめた単一書き込み
+        filepath.write_text(content, encoding="utf-8")
         return filepath
     except Exception as e:
         raise RuntimeError(f"保存エラー: {e}") from e
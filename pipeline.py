@@ -10,7 +10,7 @@ from datetime import datetime
 from pathlib import Path
 
 import numpy as np
-from scipy.io import wavfile
+import soundfile as sf
 
 from config import CONFIG_PATH, VoiceNoteConfig, configure_interactive, load_config, save_config
 from formatter import format_transcription
@@ -50,14 +50,14 @@ def load_or_configure(
 def save_wav(audio_data: np.ndarray, dest_dir: Path) -> Path:
     """録音データを `dest_dir/YYYY-MM-DD_HHMMSS_recording.wav` として保存する。
 
-    float32 (-1.0〜1.0) を int16 に変換して書き出す。
+    float32 (-1.0〜1.0) → int16 の変換は libsndfile が書き込みと同時に行うため、
+    int16 の中間バッファ（録音データと同サイズの追加コピー）を作らない。
     """
     dest_dir = Path(dest_dir)
     dest_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
     audio_file = dest_dir / f"{timestamp}_recording.wav"
-    audio_int16 = (audio_data * 32767).astype(np.int16)
-    wavfile.write(audio_file, SAMPLE_RATE, audio_int16)
+    sf.write(str(audio_file), audio_data, SAMPLE_RATE, subtype="PCM_16")
     return audio_file
 
 
@@ -65,6 +65,7 @@ def transcribe_and_save(
     audio_file: Path,
     config: VoiceNoteConfig,
     progress_callback: Callable[[str], None] | None = None,
+    audio_data: np.ndarray | None = None,
 ) -> Path:
     """音声ファイルを文字起こし → 整形 → ノート保存し、保存先パスを返す。
 
@@ -74,6 +75,8 @@ def transcribe_and_save(
             `vad_filter` `format_mode` を参照する。
         progress_callback: 進捗メッセージを受け取るコールバック。
             GUI なら UI キュー経由、CLI なら Rich Progress 経由で消費する。
+        audio_data: 録音直後の float32 データ。録音モードから渡すと
+            local モードでは audio_file の再デコードを省略できる。
 
     Returns:
         保存された Markdown ファイルパス。
@@ -82,7 +85,9 @@ def transcribe_and_save(
         RuntimeError: 文字起こし・整形・保存のいずれかが失敗した場合。
     """
 
-    transcription = transcribe(audio_file, config, progress_callback=progress_callback)
+    transcription = transcribe(
+        audio_file, config, progress_callback=progress_callback, audio_data=audio_data
+    )
 
     if config.format_mode != "none":
         transcription = format_transcription(
@@ -12,6 +12,9 @@ import sounddevice as sd
 
 SAMPLE_RATE = 16000
 
+# 録音バッファの初期容量（秒）。超過時は倍々で再確保する
+_INITIAL_BUFFER_SECONDS = 60
+
 
 def list_devices() -> list[dict]:
     """利用可能な入力デバイス一覧を返す"""
@@ -49,18 +52,26 @@ class ThreadedRecorder:
 
     def __init__(self, device_id: int | None = None):
         self._device_id = device_id
-        self._data: list[np.ndarray] = []
+        self._buffer = np.empty(0, dtype=np.float32)
+        self._write_idx = 0
         self._lock = threading.Lock()
         self._stream: sd.InputStream | None = None
         self._running = False
 
     def _callback(self, indata, frames, time, status):
+        # ブロック毎の append + 最後の concatenate はアロケーションが多く
+        # リアルタイムスレッドに不向きなため、事前確保バッファへのスライス代入にする
         if self._running:
             with self._lock:
-                self._data.append(indata.copy())
+                end = self._write_idx + frames
+                if end > self._buffer.size:
+                    self._buffer = np.resize(self._buffer, max(self._buffer.size * 2, end))
+                self._buffer[self._write_idx : end] = indata[:, 0]
+                self._write_idx = end
 
     def start(self):
-        self._data = []
+        self._buffer = np.empty(SAMPLE_RATE * _INITIAL_BUFFER_SECONDS, dtype=np.float32)
+        self._write_idx = 0
         self._running = True
         self._stream = sd.InputStream(
             samplerate=SAMPLE_RATE,
@@ -80,9 +91,9 @@ class ThreadedRecorder:
 
     def get_data(self) -> np.ndarray:
         with self._lock:
-            if not self._data:
+            if self._write_idx == 0:
                 raise RuntimeError("録音データがありません")
-            return np.concatenate(self._data, axis=0).flatten()
+            return self._buffer[: self._write_idx]
 
 
 def record_audio(
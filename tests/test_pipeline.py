@@ -37,11 +37,11 @@ class TestSaveWav:
         saved = save_wav(audio, tmp_path)
         _, data = wavfile.read(str(saved))
         assert data.dtype == np.int16
-        # 0.5 * 32767 ≈ 16383, -1.0 * 32767 = -32767
+        # libsndfile は 32768 倍してクリップする: 0.5 → 16384, 1.0 → 32767, -1.0 → -32768
         assert data[0] == 0
-        assert abs(int(data[1]) - 16383) <= 1
+        assert abs(int(data[1]) - 16384) <= 1
         assert int(data[2]) == 32767
-        assert int(data[3]) == -32767
+        assert int(data[3]) == -32768
 
     def test_preserves_sample_count(self, tmp_path: Path):
         n_samples = SAMPLE_RATE * 2  # 2秒分
@@ -6,10 +6,49 @@
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from config import VoiceNoteConfig
-from transcriber import transcribe, transcribe_audio_openai
+from transcriber import (
+    transcribe,
+    transcribe_audio,
+    transcribe_audio_openai,
+    transcribe_audio_stream,
+)
+
+
+class TestTranscribeAudioStream:
+    """ストリーム版と一括版の等価性を検証する。モデルは monkeypatch で置き換える。"""
+
+    @pytest.fixture
+    def fake_model(self, monkeypatch):
+        from types import SimpleNamespace
+
+        segments = [
+            SimpleNamespace(start=0.0, end=1.0, text=" こんにちは "),
+            SimpleNamespace(start=1.5, end=2.5, text="テストです"),
+            SimpleNamespace(start=5.0, end=6.0, text="次の段落"),  # 2秒超の間隔 → 段落区切り
+        ]
+
+        class FakeModel:
+            def transcribe(self, audio, **kwargs):
+                return iter(segments), None
+
+        monkeypatch.setattr("transcriber._get_model", lambda *args, **kwargs: FakeModel())
+
+    def test_yields_parts_with_separators(self, fake_model):
+        audio = np.full(16000, 0.1, dtype=np.float32)
+        parts = list(transcribe_audio_stream(audio, "small"))
+
+        assert parts == ["こんにちは", " テストです", "\n\n次の段落"]
+
+    def test_join_matches_transcribe_audio(self, fake_model):
+        audio = np.full(16000, 0.1, dtype=np.float32)
+
+        streamed = "".join(transcribe_audio_stream(audio, "small")).strip()
+        assert streamed == transcribe_audio(audio, "small")
+        assert streamed == "こんにちは テストです\n\n次の段落"
 
 
 class TestTranscribeAudioOpenai:
@@ -17,13 +56,31 @@ class TestTranscribeAudioOpenai:
         with pytest.raises(ValueError, match="OpenAI APIキー"):
             transcribe_audio_openai(Path("/tmp/audio.wav"), None)
 
+    def test_raises_value_error_for_oversized_non_wav(self, tmp_path, monkeypatch):
+        # WAV以外は分割できないため、上限超過は従来どおりエラーにする
+        monkeypatch.setattr("transcriber._OPENAI_MAX_BYTES", 10)
+        audio = tmp_path / "big.mp3"
+        audio.write_bytes(b"x" * 11)
+        with pytest.raises(ValueError, match="25MB"):
+            transcribe_audio_openai(audio, "sk-test")
+
 
 class TestTranscribe:
     def test_local_mode_calls_transcribe_audio(self, monkeypatch):
         calls = {}
 
-        def fake_transcribe_audio(audio_path, model_name, progress_callback=None, vad_filter=True):
+        def fake_transcribe_audio(
+            audio_path,
+            model_name,
+            progress_callback=None,
+            vad_filter=True,
+            beam_size=1,
+            device="auto",
+            compute_type="auto",
+            cpu_threads=0,
+        ):
             calls["args"] = (audio_path, model_name, progress_callback, vad_filter)
+            calls["tuning"] = (device, compute_type, cpu_threads)
             return "local result"
 
         def fake_transcribe_audio_openai(audio_path, api_key, progress_callback=None):
@@ -40,11 +97,12 @@ class TestTranscribe:
 
         assert result == "local result"
         assert calls["args"] == (audio_path, "small", None, False)
+        assert calls["tuning"] == ("auto", "auto", 0)
 
     def test_openai_mode_calls_transcribe_audio_openai(self, monkeypatch):
         calls = {}
 
-        def fake_transcribe_audio(audio_path, model_name, progress_callback=None, vad_filter=True):
+        def fake_transcribe_audio(audio_path, model_name, progress_callback=None, **kwargs):
             raise AssertionError("local 版は呼ばれてはいけない")
 
         def fake_transcribe_audio_openai(audio_path, api_key, progress_callback=None):
@@ -62,10 +120,42 @@ class TestTranscribe:
         assert result == "openai result"
         assert calls["args"] == (audio_path, "sk-test", None)
 
+    def test_local_mode_prefers_audio_data_over_path(self, monkeypatch):
+        received = {}
+
+        def fake_transcribe_audio(audio_source, model_name, progress_callback=None, **kwargs):
+            received["source"] = audio_source
+            return "ok"
+
+        monkeypatch.setattr("transcriber.transcribe_audio", fake_transcribe_audio)
+
+        config = VoiceNoteConfig(transcription_mode="local")
+        # 無音スキップに引っかからないよう発話相当の振幅を入れる
+        audio_data = np.full(16000, 0.1, dtype=np.float32)
+        transcribe(Path("/tmp/audio.wav"), config, audio_data=audio_data)
+
+        assert received["source"] is audio_data
+
+    def test_silent_audio_data_short_circuits(self, monkeypatch):
+        def fail_transcribe_audio(*args, **kwargs):
+            raise AssertionError("無音録音では transcribe_audio が呼ばれてはいけない")
+
+        monkeypatch.setattr("transcriber.transcribe_audio", fail_transcribe_audio)
+
+        messages: list[str] = []
+        config = VoiceNoteConfig(transcription_mode="local")
+        silent = np.zeros(16000, dtype=np.float32)
+        result = transcribe(
+            Path("/tmp/audio.wav"), config, progress_callback=messages.append, audio_data=silent
+        )
+
+        assert result == ""
+        assert any("スキップ" in msg for msg in messages)
+
     def test_progress_callback_is_passed_through(self, monkeypatch):
         received = {}
 
-        def fake_transcribe_audio(audio_path, model_name, progress_callback=None, vad_filter=True):
+        def fake_transcribe_audio(audio_path, model_name, progress_callback=None, **kwargs):
             received["callback"] = progress_callback
             return "ok"
 
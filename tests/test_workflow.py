@@ -184,7 +184,7 @@ class TestRecordingWorkflowStopAndProcess:
         monkeypatch.setattr(
             workflow_module,
             "transcribe_and_save",
-            lambda audio_file, config, progress_callback=None: saved_note,
+            lambda audio_file, config, progress_callback=None, audio_data=None: saved_note,
         )
 
         spy = SpyCallbacks()
@@ -286,7 +286,7 @@ class TestRecordingWorkflowTranscribeOnly:
         monkeypatch.setattr(
             workflow_module,
             "transcribe_and_save",
-            lambda audio_file, config, progress_callback=None: saved_note,
+            lambda audio_file, config, progress_callback=None, audio_data=None: saved_note,
         )
 
         spy = SpyCallbacks()
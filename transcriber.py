@@ -3,137 +3,498 @@
 faster-whisperを使用したローカル文字起こし、またはOpenAI APIを使用したクラウド文字起こし
 """
 
+import contextlib
+import os
 import tempfile
+import threading
+import time
 from collections.abc import Callable
 from pathlib import Path
+from types import SimpleNamespace
 
-import numpy as np
+# numpy/scipy が動的リンクする BLAS が独自のスレッドプールを立てると、
+# CTranslate2 のデコーダスレッド (cpu_threads) と CPU を奪い合う。
+# BLAS 側は1本に固定する（numpy import 前に設定が必要）。
+# OMP_NUM_THREADS は CTranslate2 自身が intra-op 並列に使うため触らない。
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
 
-from config import VoiceNoteConfig, resolve_api_key
+import numpy as np  # noqa: E402
+
+from config import VoiceNoteConfig, get_openai_client, resolve_api_key
 
 PAUSE_THRESHOLD = 2.0
 TARGET_SAMPLE_RATE = 16000
 
 
-def _preprocess_audio(audio_path: Path) -> Path:
+class TranscriptionError(RuntimeError):
+    """文字起こし（ローカル・API問わず）が失敗した場合に送出する。
+
+    RuntimeError の派生なので、既存の `except RuntimeError` を使う呼び出し元は
+    そのまま捕捉できる。プロセスを殺さずリトライしたい呼び出し元はこちらを捕捉する。
+    """
+
+
+# デコード進捗を UI に報告する最短間隔（秒）
+_PROGRESS_INTERVAL = 1.0
+
+# OpenAI API のアップロード上限 (25MB)。超過する WAV はこのサイズを超えない
+# チャンクに分割して並列に文字起こしする
+_OPENAI_MAX_BYTES = 25 * 1024 * 1024
+_OPENAI_CHUNK_TARGET_BYTES = 20 * 1024 * 1024
+_OPENAI_MAX_PARALLEL = 4
+
+# 無音判定: 振幅がこの値（約 -40dBFS）を超えるサンプルが _MIN_SPEECH_SECONDS 分
+# 未満なら発話なしとみなす
+_SILENCE_AMPLITUDE = 0.01
+_MIN_SPEECH_SECONDS = 0.2
+
+# 速度優先エイリアス。VOICENOTE_PREFER_TURBO=1 のとき、WERがほぼ等価で2〜4倍高速な
+# turbo 版に差し替える。distil-* 系は英語専用のため、多言語（日本語）で使える
+# large-v3-turbo のみ対象にする
+_FAST_ALIASES = {
+    "large": "large-v3-turbo",
+    "large-v3": "large-v3-turbo",
+}
+
+# Silero VAD のパラメータ。500ms 以上続く無音を発話区切りとして除去する
+# （デフォルトの 2000ms より積極的に削り、エンコーダに渡す 30 秒窓の数を減らす）
+_VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+
+# ロード済み WhisperModel のキャッシュ。モデルロードは数秒かかり数百MBをmmapするため、
+# 同一プロセス内での2回目以降の文字起こし（GUIでの連続実行など）では再利用する
+_model_cache: dict[tuple[str, str, str], "WhisperModel"] = {}  # noqa: F821
+_model_lock = threading.Lock()
+
+
+def _resolve_model_name(model_name: str) -> str:
+    """VOICENOTE_PREFER_TURBO=1 のとき、速度優先エイリアスを適用したモデル名を返す。
+
+    キャッシュキーも通知メッセージも実際にロードするモデルを指すよう、
+    エイリアスの解決はこの1箇所に集約する。
+    """
+    if os.environ.get("VOICENOTE_PREFER_TURBO") == "1":
+        return _FAST_ALIASES.get(model_name, model_name)
+    return model_name
+
+
+def _get_model(
+    model_name: str, device: str = "auto", compute_type: str = "auto", cpu_threads: int = 0
+):
+    """WhisperModel をロードする。同一設定でロード済みならキャッシュを返す。
+
+    ロックで直列化するため、プリロードスレッドと文字起こし本体が同時に
+    同じモデルを二重ロードすることはない。cpu_threads はプロセス内で固定の
+    前提とし、キャッシュキーには含めない。
+    """
+    from faster_whisper import WhisperModel
+
+    model_name = _resolve_model_name(model_name)
+
+    key = (model_name, device, compute_type)
+    with _model_lock:
+        if key not in _model_cache:
+            _model_cache[key] = WhisperModel(
+                model_name,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=1,
+            )
+        return _model_cache[key]
+
+
+# _warm_up 済みモデルのキャッシュキー。ウォームアップはモデルごとに1回で十分。
+# id(model) は解放後に別モデルへ再利用され得るため、キーで記録する
+_warmed_keys: set[tuple[str, str, str]] = set()
+
+
+def _warm_up(model, key: tuple[str, str, str]) -> None:
+    """1秒の無音でデコーダを空走させ、遅延初期化をプリロード時に済ませる。
+
+    CTranslate2 はワークスペース等を最初の transcribe 呼び出しで確保するため、
+    初回の実文字起こしが1〜3秒余分にかかる。録音中の空き時間に払っておく。
+    key は _model_cache と同じ (model_name, device, compute_type)。
+    """
+    with _model_lock:
+        if key in _warmed_keys:
+            return
+        # デコード前に記録し、並行プリロードが同じモデルを二重に空走させないようにする
+        _warmed_keys.add(key)
+    silence = np.zeros(TARGET_SAMPLE_RATE, dtype=np.float32)
+    segments, _ = model.transcribe(silence, beam_size=1)
+    for _ in segments:
+        pass
+
+
+def unload_models() -> None:
+    """キャッシュ済みの WhisperModel を全て解放する。
+
+    大きいモデルはプロセス内に数百MB常駐するため、長時間稼働する GUI で
+    メモリを返したい場合に呼ぶ。次回の文字起こしは再ロード・再ウォームアップになる。
+    """
+    with _model_lock:
+        _model_cache.clear()
+        _warmed_keys.clear()
+
+
+def preload_model(
+    model_name: str, device: str = "auto", compute_type: str = "auto", cpu_threads: int = 0
+) -> threading.Thread:
+    """WhisperModel のロードとウォームアップをバックグラウンドで開始する。
+
+    録音中はCPUがほぼ空いているため、録音開始時に呼んでおくと停止時には
+    モデルがロード・ウォームアップ済みで、その分の待ち時間がまるごと隠れる。
+    ロード失敗はここでは握りつぶし、実際の文字起こし時に改めて報告させる。
+
+    Returns:
+        ロードを実行中のデーモンスレッド
+    """
+
+    def _load():
+        with contextlib.suppress(Exception):
+            model = _get_model(
+                model_name, device=device, compute_type=compute_type, cpu_threads=cpu_threads
+            )
+            _warm_up(model, (_resolve_model_name(model_name), device, compute_type))
+
+    thread = threading.Thread(target=_load, daemon=True)
+    thread.start()
+    return thread
+
+
+def _preprocess_audio(audio_path: Path) -> Path | np.ndarray:
     """
-    音声ファイルをWhisper最適形式（16kHz・モノラル）に変換する。
-    変換が不要な場合は元のパスをそのまま返す。
+    WAVファイルをWhisper最適形式（16kHz・モノラル・float32）の配列にデコードする。
+
+    scipy の wavfile を mmap で開き、正規化・リサンプリングまでプロセス内で済ませて
+    配列をそのまま推論に渡す。以前のように変換結果を一時WAVへ書き戻して
+    faster-whisper に再デコードさせる往復（ディスク書き込み + 再デコード）を省く。
+    WAV以外は faster-whisper が PyAV でプロセス内デコードするため、パスのまま返す。
 
     Args:
         audio_path: 入力音声ファイルパス
 
     Returns:
-        変換後（または元）のファイルパス
+        float32・16kHz・モノラルの numpy 配列（WAVの場合）、または元のパス
     """
     from scipy.io import wavfile
 
     if audio_path.suffix.lower() != ".wav":
         return audio_path
 
-    sample_rate, data = wavfile.read(str(audio_path))
-
-    needs_resample = sample_rate != TARGET_SAMPLE_RATE
-    needs_mono = data.ndim > 1
-
-    if not needs_resample and not needs_mono:
-        return audio_path
+    # mmap で開くと PCM データはページキャッシュから直接参照され、
+    # ファイル全体を一度にヒープへコピーする read が発生しない
+    try:
+        sample_rate, data = wavfile.read(str(audio_path), mmap=True)
+    except ValueError:
+        # 24bit PCM などサンプル幅がバイト境界の都合で mmap 非対応の形式は通常読みに
+        # フォールバックする（int32 として読まれ、下の /2^31 正規化がそのまま効く）
+        sample_rate, data = wavfile.read(str(audio_path))
+
+    # float32 [-1, 1] に正規化（整数PCMはフルスケールで割る）
+    if data.dtype == np.int16:
+        audio = data.astype(np.float32) / 32768.0
+    elif data.dtype == np.int32:
+        audio = data.astype(np.float32) / 2147483648.0
+    elif data.dtype == np.uint8:
+        audio = (data.astype(np.float32) - 128.0) / 128.0
+    else:
+        # 既に float32 のモノラル16kHzなら mmap ビューをコピーせずそのまま使う
+        audio = np.asarray(data, dtype=np.float32)
 
     # モノラル変換
-    if needs_mono:
-        data = data.mean(axis=1)
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
 
     # リサンプリング
-    if needs_resample:
+    if sample_rate != TARGET_SAMPLE_RATE:
         from math import gcd
 
         from scipy.signal import resample_poly
 
         g = gcd(TARGET_SAMPLE_RATE, sample_rate)
-        data = resample_poly(data, TARGET_SAMPLE_RATE // g, sample_rate // g)
+        audio = resample_poly(audio, TARGET_SAMPLE_RATE // g, sample_rate // g)
+
+    return np.asarray(audio, dtype=np.float32)
+
+
+def _is_silent(audio: np.ndarray) -> bool:
+    """録音データに発話相当の信号が無いかを振幅ベースで簡易判定する。
+
+    numpy の1パス走査（数十ms）で済み、誤起動の空録音に対して
+    モデルロード・推論のコストを丸ごと省ける。
+    """
+    speech_samples = np.count_nonzero(np.abs(audio) > _SILENCE_AMPLITUDE)
+    return speech_samples < int(_MIN_SPEECH_SECONDS * TARGET_SAMPLE_RATE)
 
-    # float → int16に変換（wavfile書き込みのため）
-    if data.dtype != np.int16:
-        max_val = np.max(np.abs(data))
-        data = (data / max_val * 32767).astype(np.int16) if max_val > 0 else data.astype(np.int16)
 
-    # 呼び出し元で transcribe 後に unlink するため delete=False で開いて閉じる
-    tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)  # noqa: SIM115
-    tmp_path = Path(tmp.name)
-    tmp.close()
-    wavfile.write(str(tmp_path), TARGET_SAMPLE_RATE, data)
-    return tmp_path
+def _iter_merged_parts(segments, on_progress: Callable[[str], None] | None = None):
+    """セグメントを区切り文字付きのテキスト片として逐次 yield する（2秒以上の間隔で段落分け）。
 
+    このループは CTranslate2 のデコーダジェネレータを駆動するホットパスなので、
+    セグメントあたりの Python 処理は区切り文字を前置した1回の yield に抑える。
+    全片を連結すると _merge_segments と同じ文字列になる。
 
-def _merge_segments(segments) -> str:
-    """セグメントを結合する（2秒以上の間隔で段落分け）"""
-    result_parts = []
+    Args:
+        segments: faster-whisper のセグメント（ジェネレータ可）
+        on_progress: デコード済み位置を受け取るコールバック。UI 更新がデコーダを
+            停滞させないよう、呼び出しは _PROGRESS_INTERVAL 秒ごとに間引く
+    """
+    # 数百セグメント規模ではグローバル/属性参照のバイトコードコストも効いてくるため、
+    # ループ内で使う名前はローカルに束縛しておく (LOAD_ATTR/LOAD_GLOBAL → LOAD_FAST)
+    pause = PAUSE_THRESHOLD
+    monotonic = time.monotonic
+    first = True
     prev_end = 0.0
+    next_report = monotonic() + _PROGRESS_INTERVAL
     for segment in segments:
-        gap = segment.start - prev_end
-        if result_parts and gap >= PAUSE_THRESHOLD:
-            result_parts.append("\n\n")
-        elif result_parts:
-            result_parts.append(" ")
-        result_parts.append(segment.text.strip())
+        if first:
+            sep = ""
+            first = False
+        elif segment.start - prev_end >= pause:
+            sep = "\n\n"
+        else:
+            sep = " "
+        yield sep + segment.text.strip()
         prev_end = segment.end
-    return "".join(result_parts).strip()
+        if on_progress is not None and monotonic() >= next_report:
+            on_progress(f"文字起こし中... ({prev_end:.0f}秒まで完了)")
+            next_report = monotonic() + _PROGRESS_INTERVAL
 
 
-def transcribe_audio(
-    audio_path: Path,
+def _merge_segments(segments, on_progress: Callable[[str], None] | None = None) -> str:
+    """セグメントを1つの文字列に結合する（_iter_merged_parts の連結版）。"""
+    return "".join(_iter_merged_parts(segments, on_progress=on_progress)).strip()
+
+
+def transcribe_audio_stream(
+    audio_source: Path | np.ndarray,
     model_name: str,
     progress_callback: Callable[[str], None] | None = None,
     vad_filter: bool = True,
-) -> str:
+    beam_size: int = 1,
+    device: str = "auto",
+    compute_type: str = "auto",
+    cpu_threads: int = 0,
+):
     """
-    faster-whisperで音声を文字起こしする
+    faster-whisperで音声を文字起こしし、テキスト片を逐次 yield するジェネレータ。
+
+    各片は段落区切り（改行2つ or スペース）を前置した1セグメント分のテキストで、
+    全て連結すると transcribe_audio の戻り値と同じ文字列になる。デコードの完了を
+    待たずに下流（逐次表示・LLM整形など）が処理を始められ、長い録音でも全文を
+    1つの文字列としてバッファしない。
 
     Args:
-        audio_path: 音声ファイルのパス
+        audio_source: 音声ファイルのパス、または16kHz・モノラル・float32のnumpy配列。
+            配列の場合はWAVのデコードを省略してそのまま推論に渡す。
         model_name: 使用するWhisperモデル名
         progress_callback: 進捗メッセージを受け取るコールバック（GUIから渡す）
         vad_filter: 音声区間検出フィルタの有効/無効（無音・ノイズを除去してループを抑制）
+        beam_size: デコードのビーム幅（1 = 貪欲法。最速で、音声メモでは精度差ほぼ無し）
+        device: 推論デバイス（"auto" = CUDA があれば GPU、なければ CPU）
+        compute_type: CTranslate2 の量子化タイプ（"auto" = デバイスで最速のものを選択）
+        cpu_threads: 推論スレッド数（0 = 物理コア数の自動検出）
 
-    Returns:
-        文字起こしされたテキスト
+    Yields:
+        区切り文字付きの文字起こしテキスト片
 
     Raises:
-        RuntimeError: 文字起こし失敗時
+        TranscriptionError: 文字起こし失敗時（イテレーション中に送出される）
     """
 
     def notify(msg: str):
         if progress_callback:
             progress_callback(msg)
 
-    notify(f"モデル '{model_name}' をロード中...")
+    model_name = _resolve_model_name(model_name)
+    if (model_name, device, compute_type) not in _model_cache:
+        notify(f"モデル '{model_name}' をロード中...")
 
-    preprocessed_path = None
     try:
-        from faster_whisper import WhisperModel
+        model = _get_model(
+            model_name, device=device, compute_type=compute_type, cpu_threads=cpu_threads
+        )
 
-        model = WhisperModel(model_name, device="cpu", compute_type="int8")
-        notify("音声ファイルを最適化中...")
+        if isinstance(audio_source, np.ndarray):
+            # 録音直後のデータは既にWhisper最適形式（16kHz・モノラル）
+            transcribe_input = audio_source
+        else:
+            notify("音声ファイルを最適化中...")
+            preprocessed = _preprocess_audio(audio_source)
+            transcribe_input = (
+                preprocessed if isinstance(preprocessed, np.ndarray) else str(preprocessed)
+            )
 
-        preprocessed_path = _preprocess_audio(audio_path)
         notify("文字起こし中...")
 
         segments, _ = model.transcribe(
-            str(preprocessed_path),
-            beam_size=5,
+            transcribe_input,
+            beam_size=beam_size,
             condition_on_previous_text=False,
             vad_filter=vad_filter,
+            vad_parameters=_VAD_PARAMETERS,
         )
-        transcription = _merge_segments(segments)
+        yield from _iter_merged_parts(segments, on_progress=progress_callback)
 
         notify("文字起こし完了")
-        return transcription
 
     except Exception as e:
-        raise RuntimeError(f"文字起こしエラー: {e}") from e
-    finally:
-        if preprocessed_path and preprocessed_path != audio_path:
-            preprocessed_path.unlink(missing_ok=True)
+        raise TranscriptionError(f"文字起こしエラー: {e}") from e
+
+
+def transcribe_audio(
+    audio_source: Path | np.ndarray,
+    model_name: str,
+    progress_callback: Callable[[str], None] | None = None,
+    vad_filter: bool = True,
+    beam_size: int = 1,
+    device: str = "auto",
+    compute_type: str = "auto",
+    cpu_threads: int = 0,
+) -> str:
+    """
+    faster-whisperで音声を文字起こしし、全文を1つの文字列として返す。
+
+    内部では transcribe_audio_stream を消費して連結するだけの互換ラッパー。
+    逐次処理したい呼び出し元はストリーム版を直接使う。引数は同一。
+
+    Returns:
+        文字起こしされたテキスト
+
+    Raises:
+        TranscriptionError: 文字起こし失敗時
+    """
+    return "".join(
+        transcribe_audio_stream(
+            audio_source,
+            model_name,
+            progress_callback=progress_callback,
+            vad_filter=vad_filter,
+            beam_size=beam_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+        )
+    ).strip()
+
+
+def transcribe_many(
+    paths: list[Path],
+    model_name: str,
+    batch_size: int = 8,
+    progress_callback: Callable[[str], None] | None = None,
+    device: str = "auto",
+    compute_type: str = "auto",
+    cpu_threads: int = 0,
+) -> list[str]:
+    """複数の音声ファイルを1つのモデルセッションでバッチ文字起こしする。
+
+    BatchedInferencePipeline が各ファイル内の発話区間を batch_size 件ずつ
+    まとめてエンコーダに通すため、短いメモを大量に処理する際に 1件ずつの
+    transcribe_audio よりスループットが数倍高い（エンコーダの GEMM が
+    タイルを埋め切り、モデルロードも1回で済む）。
+
+    Args:
+        paths: 音声ファイルパスのリスト（WAVは事前デコード、他形式はPyAVに委譲）
+        model_name: 使用するWhisperモデル名
+        batch_size: 同時にエンコーダへ通す発話区間の数
+        progress_callback: 進捗メッセージを受け取るコールバック
+        device: 推論デバイス（"auto" = CUDA があれば GPU、なければ CPU）
+        compute_type: CTranslate2 の量子化タイプ（"auto" = デバイスで最速のものを選択）
+        cpu_threads: 推論スレッド数（0 = 物理コア数の自動検出）
+
+    Returns:
+        paths と同順の文字起こしテキストのリスト
+
+    Raises:
+        TranscriptionError: いずれかのファイルの文字起こし失敗時
+    """
+    from faster_whisper import BatchedInferencePipeline
+
+    def notify(msg: str):
+        if progress_callback:
+            progress_callback(msg)
+
+    model_name = _resolve_model_name(model_name)
+    if (model_name, device, compute_type) not in _model_cache:
+        notify(f"モデル '{model_name}' をロード中...")
+
+    try:
+        model = _get_model(
+            model_name, device=device, compute_type=compute_type, cpu_threads=cpu_threads
+        )
+        pipe = BatchedInferencePipeline(model=model)
+
+        results: list[str] = []
+        for i, path in enumerate(paths, start=1):
+            notify(f"文字起こし中... ({i}/{len(paths)}件目: {path.name})")
+            preprocessed = _preprocess_audio(path)
+            transcribe_input = (
+                preprocessed if isinstance(preprocessed, np.ndarray) else str(preprocessed)
+            )
+            segments, _ = pipe.transcribe(transcribe_input, batch_size=batch_size)
+            results.append(_merge_segments(segments))
+
+        notify("文字起こし完了")
+        return results
+
+    except Exception as e:
+        raise TranscriptionError(f"文字起こしエラー: {e}") from e
+
+
+def _request_openai_segments(client, audio_path: Path):
+    """1ファイルを Whisper API に送り、セグメントのリストを返す。"""
+    with open(audio_path, "rb") as audio_file:
+        # (ファイル名, ハンドル) タプルを渡すと httpx がハンドルから直接
+        # multipart をストリーミングし、ファイル全体のメモリ展開を避ける
+        response = client.audio.transcriptions.create(
+            model="whisper-1",
+            file=(audio_path.name, audio_file),
+            response_format="verbose_json",
+        )
+    return response.segments
+
+
+def _transcribe_chunked_openai(client, audio_path: Path, notify: Callable[[str], None]) -> str:
+    """25MB超のWAVをチャンクに分割し、並列にAPIへ送って結果を結合する。
+
+    チャンクはPCM_16換算で20MB以下になるフレーム数で等分割し、
+    各チャンクのセグメントにオフセットを加えてから時系列順に結合する。
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import soundfile as sf
+
+    data, sample_rate = sf.read(str(audio_path), dtype="float32")
+    channels = data.shape[1] if data.ndim > 1 else 1
+    chunk_frames = _OPENAI_CHUNK_TARGET_BYTES // (channels * 2)  # PCM_16 は 2byte/サンプル
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        chunks: list[tuple[Path, float]] = []
+        for i, start in enumerate(range(0, len(data), chunk_frames)):
+            chunk_path = Path(tmp_dir) / f"chunk{i:03d}.wav"
+            sf.write(
+                str(chunk_path), data[start : start + chunk_frames], sample_rate, subtype="PCM_16"
+            )
+            chunks.append((chunk_path, start / sample_rate))
+
+        notify(f"OpenAI APIリクエスト送信中... ({len(chunks)}分割・並列)")
+        with ThreadPoolExecutor(max_workers=min(_OPENAI_MAX_PARALLEL, len(chunks))) as executor:
+            futures = [
+                executor.submit(_request_openai_segments, client, chunk_path)
+                for chunk_path, _ in chunks
+            ]
+            all_segments = [
+                SimpleNamespace(
+                    start=segment.start + offset, end=segment.end + offset, text=segment.text
+                )
+                for future, (_, offset) in zip(futures, chunks, strict=True)
+                for segment in future.result()
+            ]
+
+    return _merge_segments(all_segments)
 
 
 def transcribe_audio_openai(
@@ -144,6 +505,9 @@ def transcribe_audio_openai(
     """
     OpenAI Whisper APIで音声を文字起こしする
 
+    25MBの上限を超えるWAVはチャンクに分割して並列にアップロードし、
+    結果を時系列順に結合する。
+
     Args:
         audio_path: 音声ファイルのパス
         api_key: OpenAI APIキー
@@ -153,18 +517,16 @@ def transcribe_audio_openai(
         文字起こしされたテキスト
 
     Raises:
-        ValueError: APIキー未設定、ファイルサイズ超過
-        RuntimeError: API呼び出し失敗時
+        ValueError: APIキー未設定、または25MB超でWAV以外（分割不可）の場合
+        TranscriptionError: API呼び出し失敗時
     """
-    from openai import OpenAI
-
     if not api_key:
         raise ValueError("OpenAI APIキーが設定されていません")
 
-    file_size_mb = audio_path.stat().st_size / (1024 * 1024)
-    if file_size_mb > 25:
+    file_size = audio_path.stat().st_size
+    if file_size > _OPENAI_MAX_BYTES and audio_path.suffix.lower() != ".wav":
         raise ValueError(
-            f"ファイルサイズが25MBを超えています ({file_size_mb:.1f}MB)。"
+            f"ファイルサイズが25MBを超えています ({file_size / (1024 * 1024):.1f}MB)。"
             "長い録音はローカルモードを使用してください。"
         )
 
@@ -172,37 +534,49 @@ def transcribe_audio_openai(
         if progress_callback:
             progress_callback(msg)
 
-    notify("OpenAI APIリクエスト送信中...")
-
     try:
-        client = OpenAI(api_key=api_key)
-        with open(audio_path, "rb") as audio_file:
-            response = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                response_format="verbose_json",
-            )
+        client = get_openai_client(api_key)
+
+        if file_size > _OPENAI_MAX_BYTES:
+            transcription = _transcribe_chunked_openai(client, audio_path, notify)
+        else:
+            notify("OpenAI APIリクエスト送信中...")
+            transcription = _merge_segments(_request_openai_segments(client, audio_path))
 
-        transcription = _merge_segments(response.segments)
         notify("文字起こし完了")
         return transcription
 
     except Exception as e:
-        raise RuntimeError(f"OpenAI APIエラー: {e}") from e
+        raise TranscriptionError(f"OpenAI APIエラー: {e}") from e
 
 
 def transcribe(
     audio_path: Path,
     config: VoiceNoteConfig,
     progress_callback: Callable[[str], None] | None = None,
+    audio_data: np.ndarray | None = None,
 ) -> str:
-    """設定の transcription_mode に応じて local/openai の文字起こしをディスパッチする"""
+    """設定の transcription_mode に応じて local/openai の文字起こしをディスパッチする。
+
+    audio_data が渡された場合、local モードでは WAV の再デコードを省略して
+    そのまま推論に渡す。openai モードはファイルアップロードが必要なため
+    常に audio_path を使用する。
+    """
+    if audio_data is not None and _is_silent(audio_data):
+        if progress_callback:
+            progress_callback("⚠ 発話が検出されなかったため文字起こしをスキップしました")
+        return ""
+
     if config.transcription_mode == "openai":
         api_key = resolve_api_key(config)
         return transcribe_audio_openai(audio_path, api_key, progress_callback=progress_callback)
     return transcribe_audio(
-        audio_path,
+        audio_data if audio_data is not None else audio_path,
         config.whisper_model,
         progress_callback=progress_callback,
         vad_filter=config.vad_filter,
+        beam_size=config.beam_size,
+        device=config.device,
+        compute_type=config.compute_type,
+        cpu_threads=config.cpu_threads,
     )